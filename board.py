@@ -57,7 +57,25 @@ class Board:
         # The FEN string should start with the rank 8 and end with rank 1 (board[0][0] is the a1 square)
         fen = '/'.join(fen_rows[::-1])
         return(fen)
-    
+
+    def castling_rights(self):
+        # White's back rank is row 7 and black's is row 0; a side keeps a right
+        # while its king and the matching rook are still unmoved on their home squares
+        rights = ''
+        for color, row, symbols in (('w', 7, 'KQ'), ('b', 0, 'kq')):
+            king = self.board[row][4]
+            if not (isinstance(king, King) and king.color == color and not king.moved):
+                continue
+            for rook_col, symbol in ((7, symbols[0]), (0, symbols[1])):
+                rook = self.board[row][rook_col]
+                if isinstance(rook, Rook) and rook.color == color and not rook.moved:
+                    rights += symbol
+        return rights or '-'
+
+    def position_key(self):
+        # Normalized key for the analysis cache: placement, side to move and castling rights
+        return f"{self._toFEN()} {self.current_turn} {self.castling_rights()}"
+
     def is_in_check(self, king_color):
         # Find the king's position
         king_position = None
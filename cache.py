@@ -0,0 +1,100 @@
+import json
+import os
+import sqlite3
+import time
+
+class PositionCache:
+    # Persistent analysis cache backed by SQLite. Entries are keyed by
+    # Board.position_key() and hold the best move, score, depth and node count.
+    # WAL mode plus a busy timeout lets several worker processes share one file.
+    # Meant for search/analysis jobs: get() before searching, put() afterwards
+    # with the depth that was actually searched.
+
+    def __init__(self, path="analysis_cache.db", max_entries=100000, timeout=30.0):
+        self.path = path
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._conn = None
+        self._pid = None
+
+    ## Helper Functions
+
+    def _connection(self):
+        # sqlite connections must not be shared across a fork, so open one per process
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS positions ("
+                "key TEXT PRIMARY KEY, move TEXT, score REAL NOT NULL, "
+                "depth INTEGER NOT NULL, nodes INTEGER NOT NULL, last_used REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS positions_last_used ON positions (last_used)")
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def _encode_move(self, move):
+        return None if move is None else json.dumps(move)
+
+    def _decode_move(self, move):
+        # moves are stored as ((x, y), (x, y)) like the rest of the board code uses
+        return None if move is None else tuple(tuple(square) for square in json.loads(move))
+
+    def _evict(self, conn):
+        # Drop the least recently used entries once the table grows past max_entries
+        count = conn.execute("SELECT COUNT(*) FROM positions").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM positions WHERE key IN "
+                "(SELECT key FROM positions ORDER BY last_used LIMIT ?)",
+                (excess,),
+            )
+
+    ## Lookup and store
+
+    def get(self, key, depth=0):
+        # Only a result searched at least as deep as requested counts as a hit
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT move, score, depth, nodes FROM positions WHERE key = ? AND depth >= ?",
+            (key, depth),
+        ).fetchone()
+        if row is None:
+            return None
+        conn.execute("UPDATE positions SET last_used = ? WHERE key = ?", (time.time(), key))
+        move, score, stored_depth, nodes = row
+        return {'move': self._decode_move(move), 'score': score, 'depth': stored_depth, 'nodes': nodes}
+
+    def put(self, key, move, score, depth, nodes=0):
+        # Keep the deeper result when another worker already stored this position
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT INTO positions (key, move, score, depth, nodes, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET move = excluded.move, score = excluded.score, "
+                "depth = excluded.depth, nodes = excluded.nodes, last_used = excluded.last_used "
+                "WHERE excluded.depth >= positions.depth",
+                (key, self._encode_move(move), score, depth, nodes, time.time()),
+            )
+            self._evict(conn)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def clear(self):
+        self._connection().execute("DELETE FROM positions")
+
+    def close(self):
+        if self._conn is not None and self._pid == os.getpid():
+            self._conn.close()
+        self._conn = None
+        self._pid = None
+
+    def __len__(self):
+        return self._connection().execute("SELECT COUNT(*) FROM positions").fetchone()[0]
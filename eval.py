@@ -18,7 +18,7 @@ def score(board): # score the board on number of pieces
 
 def eval(board):
     s = 0
-    s += score(board.board)
+    s += score(board)
     return s
 
 if __name__ == "__main__":
@@ -28,4 +28,5 @@ if __name__ == "__main__":
         # fen='8/p4p2/3KP1b1/7k/6p1/8/4Q1P1/7q' # r3 (0.0)
     )
     print("FEN:", board.fen, board.current_turn)
+    print("Key:", board.position_key())
     print("Evaluation score:", eval(board))   
\ No newline at end of file